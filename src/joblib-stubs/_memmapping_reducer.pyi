@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from typing import Any
+from typing import Any, NoReturn
 
 import numpy as np
 from _typeshed import StrOrBytesPath
@@ -25,6 +25,7 @@ class _WeakArrayKeyMap:
     def __init__(self) -> None: ...
     def get(self, obj: Any) -> Any: ...
     def set(self, obj: Any, value: Any) -> None: ...
+    def __getstate__(self) -> NoReturn: ...
 
 def has_shareable_memory(a: Any) -> bool: ...
 def reduce_array_memmap_backward(
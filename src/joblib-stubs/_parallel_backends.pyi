@@ -98,6 +98,10 @@ class PoolManagerMixin:
 class AutoBatchingMixin(Generic[_R]):
     MIN_IDEAL_BATCH_DURATION: ClassVar[float]
     MAX_IDEAL_BATCH_DURATION: ClassVar[float]
+    _DEFAULT_EFFECTIVE_BATCH_SIZE: ClassVar[int]
+    _DEFAULT_SMOOTHED_BATCH_DURATION: ClassVar[float]
+    _effective_batch_size: int
+    _smoothed_batch_duration: float
     parallel: Parallel[_R]
     def __init__(self, **kwargs: Any) -> None: ...
     def compute_batch_size(self) -> int: ...
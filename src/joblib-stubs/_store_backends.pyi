@@ -1,10 +1,10 @@
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta
-from typing import Any, NamedTuple
+from typing import IO, Any, Literal, NamedTuple
 
 from joblib import numpy_pickle as numpy_pickle
-from joblib._typeshed import ItemInfo, MmapMode
+from joblib._typeshed import Compress, ItemInfo, MmapMode
 from joblib.backports import concurrency_safe_rename as concurrency_safe_rename
 from joblib.disk import memstr_to_bytes as memstr_to_bytes
 from joblib.disk import mkdirp as mkdirp
@@ -25,6 +25,12 @@ def concurrency_safe_write[T](
 class StoreBackendBase(metaclass=ABCMeta):
     location: str
     @abstractmethod
+    def _open_item(self, f: str, mode: Literal["rb", "wb"]) -> IO[bytes]: ...
+    @abstractmethod
+    def _item_exists(self, location: str) -> bool: ...
+    @abstractmethod
+    def _move_item(self, src: str, dst: str) -> None: ...
+    @abstractmethod
     def create_location(self, location: str) -> None: ...
     @abstractmethod
     def clear_location(self, location: str) -> None: ...
@@ -70,12 +76,27 @@ class StoreBackendMixin:
         items_limit: int | None = ...,
         age_limit: timedelta | None = ...,
     ) -> None: ...
+    def _get_items_to_delete(
+        self,
+        bytes_limit: int | str | None,
+        items_limit: int | None = ...,
+        age_limit: timedelta | None = ...,
+    ) -> list[CacheItemInfo]: ...
+    def _concurrency_safe_write[T](
+        self, to_write: T, filename: str, write_func: Callable[[T, str], Any]
+    ) -> None: ...
 
 class FileSystemStoreBackend(StoreBackendBase, StoreBackendMixin):
-    compress: bool
-    mmap_mode: MmapMode
+    compress: Compress
+    mmap_mode: MmapMode | None
     verbose: int
     # mypy
+    @staticmethod
+    def _open_item(f: str, mode: Literal["rb", "wb"]) -> IO[bytes]: ...
+    @staticmethod
+    def _item_exists(location: str) -> bool: ...
+    @staticmethod
+    def _move_item(src: str, dst: str) -> None: ...
     def create_location(self, location: str) -> None: ...
     def clear_location(self, location: str) -> None: ...
     def get_items(self) -> list[CacheItemInfo]: ...
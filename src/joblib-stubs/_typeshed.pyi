@@ -61,11 +61,13 @@ type DaskScatterIterItem = list[Any] | dict[Any, Any]
 type Prefer = Literal["processes", "threads"]
 type Require = Literal["sharedmem"]
 type HashType = Literal["md5", "sha1"]
+type Compress = bool | int | str | tuple[str, int]
 type MmapMode = Literal[
     "readonly", "r", "copyonwrite", "c", "readwrite", "r+", "write", "w+"
 ]
 type Reducer[T] = Callable[Concatenate[type[T], ...], Any]
 type Dispatch[T] = Callable[[Unpickler, T], None]
+type TaskStatus = Literal["Done", "Error", "Pending"]
 type ReturnList = Literal["list"]
 type ReturnGererator = Literal["generator"]
 type ReturnGereratorUnordered = Literal["generator_unordered"]
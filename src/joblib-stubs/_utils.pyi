@@ -5,7 +5,7 @@ from typing import Any, SupportsAbs
 
 from joblib._multiprocessing_helpers import mp as mp
 
-operators: dict[ast.AST, Callable[[Any, Any], Any]]
+operators: dict[type[ast.AST], Callable[..., Any]]
 
 def eval_expr(expr: str) -> Any: ...
 def limit[F: Callable[..., SupportsAbs[Any]]](
@@ -9,6 +9,7 @@ from joblib.backports import LooseVersion as LooseVersion
 from lz4.frame import LZ4FrameFile  # type: ignore[import-not-found]
 
 LZ4_NOT_INSTALLED_ERROR: str
+_COMPRESSORS: dict[str, CompressorWrapper[Any]]
 
 def register_compressor(
     compressor_name: str, compressor: CompressorWrapper[Any], force: bool = ...
@@ -1,17 +1,25 @@
 import io
 import pickle
+from _hashlib import HASH
 from collections.abc import Callable, Hashable, Iterable
 from types import ModuleType
-from typing import Any, Concatenate
+from typing import Any, ClassVar, Concatenate, Literal, overload
 
 from joblib._typeshed import HashType
 
 Pickler = pickle._Pickler  # noqa: SLF001
 
 class Hasher(Pickler):
+    dispatch: ClassVar[dict[type[Any], Callable[[Any, Any], None]]]
     stream: io.BytesIO
-    def __init__(self, hash_name: HashType = ...) -> None: ...
-    def hash(self, obj: Any, return_digest: bool = ...) -> str: ...
+    _hash: HASH
+    def __init__(self, hash_name: str = ...) -> None: ...
+    @overload
+    def hash(self, obj: Any, return_digest: Literal[True] = ...) -> str: ...
+    @overload
+    def hash(self, obj: Any, return_digest: Literal[False]) -> None: ...
+    @overload
+    def hash(self, obj: Any, return_digest: bool) -> str | None: ...
     def save(self, obj: Any) -> None: ...
     def memoize(self, obj: Any) -> None: ...
     def save_global(
@@ -20,13 +28,12 @@ class Hasher(Pickler):
         name: str | None = ...,
         pack: Callable[Concatenate[str | bytes, ...], bytes] = ...,
     ) -> None: ...
-    # dispatch: dict[type[typing.Any], _Dispatch[typing.Any]]  # noqa: ERA001
     def save_set(self, set_items: Iterable[Hashable]) -> None: ...
 
 class NumpyHasher(Hasher):
     coerce_mmap: bool
     np: ModuleType
-    def __init__(self, hash_name: HashType = ..., coerce_mmap: bool = ...) -> None: ...
+    def __init__(self, hash_name: str = ..., coerce_mmap: bool = ...) -> None: ...
     def save(self, obj: Any) -> None: ...
 
 def hash(  # noqa: A001
@@ -7,7 +7,7 @@ from joblib import hashing as hashing
 from joblib._store_backends import CacheWarning as CacheWarning
 from joblib._store_backends import FileSystemStoreBackend as FileSystemStoreBackend
 from joblib._store_backends import StoreBackendBase as StoreBackendBase
-from joblib._typeshed import MemoryCacheFunc, MmapMode
+from joblib._typeshed import Compress, MemoryCacheFunc, MmapMode
 from joblib.func_inspect import filter_args as filter_args
 from joblib.func_inspect import format_call as format_call
 from joblib.func_inspect import format_signature as format_signature
@@ -29,14 +29,14 @@ def register_store_backend(
 
 class MemorizedResult[T](Logger):
     store_backend: StoreBackendBase
-    mmap_mode: MmapMode
+    mmap_mode: MmapMode | None
     metadata: dict[str, Any]
-    duration: float
+    duration: float | None
     verbose: int
-    timestamp: float
+    timestamp: float | None
     def __init__(
         self,
-        location: str,
+        location: str | Path | StoreBackendBase,
         call_id: tuple[str, ...],
         backend: str = ...,
         mmap_mode: MmapMode | None = ...,
@@ -50,8 +50,6 @@ class MemorizedResult[T](Logger):
     def func_id(self) -> str: ...
     @property
     def args_id(self) -> str: ...
-    @property
-    def argument_hash(self) -> str: ...
     def get(self) -> T: ...
     def clear(self) -> None: ...
 
@@ -71,7 +69,7 @@ class NotMemorizedFunc[**P, T]:
     ) -> NotMemorizedResult[T]: ...
     def clear(self, warn: bool = ...) -> None: ...
     def call(self, *args: P.args, **kwargs: P.kwargs) -> tuple[T, dict[Any, Any]]: ...
-    def check_call_in_cache(self, *args: Any, **kwargs: Any) -> bool: ...
+    def check_call_in_cache(self, *args: P.args, **kwargs: P.kwargs) -> bool: ...
 
 class AsyncNotMemorizedFunc[**P, T](NotMemorizedFunc[P, Awaitable[T]]):
     func: Callable[P, Awaitable[T]]
@@ -81,12 +79,10 @@ class AsyncNotMemorizedFunc[**P, T](NotMemorizedFunc[P, Awaitable[T]]):
     async def call_and_shelve(
         self, *args: P.args, **kwargs: P.kwargs
     ) -> NotMemorizedResult[T]: ...
-    # pyrefly: ignore [bad-override]
-    def call(self) -> tuple[Awaitable[T], dict[Any, Any]]: ...
 
 class MemorizedFunc[**P, T](Logger):
-    mmap_mode: MmapMode
-    compress: bool | int
+    mmap_mode: MmapMode | None
+    compress: Compress
     func: Callable[P, T]
     cache_validation_callback: Callable[..., Any] | None
     func_id: str
@@ -96,11 +92,11 @@ class MemorizedFunc[**P, T](Logger):
     def __init__(
         self,
         func: Callable[P, T],
-        location: str,
+        location: str | Path | StoreBackendBase,
         backend: str = ...,
         ignore: list[str] | None = ...,
         mmap_mode: MmapMode | None = ...,
-        compress: bool | int = ...,
+        compress: Compress = ...,
         verbose: int = ...,
         timestamp: float | None = ...,
         cache_validation_callback: Callable[..., Any] | None = ...,
@@ -120,11 +116,11 @@ class AsyncMemorizedFunc[**P, T](MemorizedFunc[P, Awaitable[T]]):
     def __init__(
         self,
         func: Callable[P, Awaitable[T]],
-        location: str,
+        location: str | Path | StoreBackendBase,
         backend: str = ...,
         ignore: list[str] | None = ...,
         mmap_mode: MmapMode | None = ...,
-        compress: bool | int = ...,
+        compress: Compress = ...,
         verbose: int = ...,
         timestamp: float | None = ...,
         cache_validation_callback: Callable[..., Any] | None = ...,
@@ -140,19 +136,19 @@ class AsyncMemorizedFunc[**P, T](MemorizedFunc[P, Awaitable[T]]):
     ) -> tuple[T, dict[str, Any]]: ...
 
 class Memory(Logger):
-    mmap_mode: MmapMode
+    mmap_mode: MmapMode | None
     timestamp: float
     backend: str
-    compress: bool | int
+    compress: Compress
     backend_options: dict[str, Any]
-    location: str | Path
+    location: str | Path | StoreBackendBase | None
     store_backend: StoreBackendBase
     def __init__(
         self,
-        location: str | Path | None = ...,
+        location: str | Path | StoreBackendBase | None = ...,
         backend: str = ...,
         mmap_mode: MmapMode | None = ...,
-        compress: bool | int = ...,
+        compress: Compress = ...,
         verbose: int = ...,
         backend_options: dict[str, Any] | None = ...,
     ) -> None: ...
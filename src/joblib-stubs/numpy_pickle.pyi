@@ -1,10 +1,11 @@
+from collections.abc import Callable
 from pathlib import Path
 from types import ModuleType
-from typing import Any, BinaryIO, ClassVar, Literal
+from typing import Any, BinaryIO, ClassVar, Literal, overload
 
 import numpy as np
 from _typeshed import SupportsRead, SupportsWrite
-from joblib._typeshed import Dispatch, MmapMode
+from joblib._typeshed import Compress, Dispatch, MmapMode
 from joblib.backports import make_memmap as make_memmap
 from joblib.compressor import LZ4_NOT_INSTALLED_ERROR as LZ4_NOT_INSTALLED_ERROR
 from joblib.compressor import BinaryZlibFile as BinaryZlibFile
@@ -32,7 +33,7 @@ class NumpyArrayWrapper:
     order: Literal["C", "F"]
     dtype: DTypeLike
     allow_mmap: bool
-    numpy_array_alignment_bytes: int
+    numpy_array_alignment_bytes: int | None
     def __init__(
         self,
         subclass: type[NDArray[Any]],
@@ -40,34 +41,35 @@ class NumpyArrayWrapper:
         order: Literal["C", "F"],
         dtype: DTypeLike,
         allow_mmap: bool = ...,
-        numpy_array_alignment_bytes: bool = ...,
+        numpy_array_alignment_bytes: int | None = ...,
     ) -> None: ...
-    def safe_get_numpy_array_alignment_bytes(self) -> Any: ...
-    def write_array(self, array: NDArray[Any], pickler: Pickler) -> None: ...
+    def safe_get_numpy_array_alignment_bytes(self) -> int | None: ...
+    def write_array(self, array: NDArray[Any], pickler: NumpyPickler) -> None: ...
     def read_array(
-        self, unpickler: Unpickler, ensure_native_byte_order: bool
+        self, unpickler: NumpyUnpickler, ensure_native_byte_order: bool
     ) -> NDArray[Any]: ...
-    def read_mmap(self, unpickler: Unpickler) -> np.memmap[Any, Any]: ...
+    def read_mmap(self, unpickler: NumpyUnpickler) -> np.memmap[Any, Any]: ...
     def read(
-        self, unpickler: Unpickler, ensure_native_byte_order: bool
+        self, unpickler: NumpyUnpickler, ensure_native_byte_order: bool
     ) -> NDArray[Any]: ...
 
 class NumpyPickler(Pickler):
     dispatch: ClassVar[dict[type[Any], Dispatch[Any]]]
     file_handle: BinaryIO
     buffered: bool
-    np: ModuleType
+    np: ModuleType | None
     def __init__(self, fp: BinaryIO, protocol: int | None = ...) -> None: ...
+    def _create_array_wrapper(self, array: NDArray[Any]) -> NumpyArrayWrapper: ...
     def save(self, obj: Any) -> None: ...
 
 class NumpyUnpickler(Unpickler):
-    # dispatch: typing.ClassVar[dict[type[typing.Any], Dispatch[typing.Any]]]  # noqa: ERA001, E501
-    mmap_mode: MmapMode
+    dispatch: ClassVar[dict[int, Callable[[Any], None]]]
+    mmap_mode: MmapMode | None
     file_handle: BinaryIO
     filename: str
     compat_mode: bool
     ensure_native_byte_order: bool
-    np: ModuleType
+    np: ModuleType | None
     def __init__(
         self,
         filename: str,
@@ -77,12 +79,20 @@ class NumpyUnpickler(Unpickler):
     ) -> None: ...
     def load_build(self) -> None: ...
 
+@overload
 def dump(
     value: Any,
-    filename: str | Path | SupportsWrite[bytes],
-    compress: int | bool | tuple[str, int] = ...,
+    filename: str | Path,
+    compress: Compress = ...,
     protocol: int | None = ...,
-) -> list[str] | None: ...
+) -> list[str]: ...
+@overload
+def dump(
+    value: Any,
+    filename: SupportsWrite[bytes],
+    compress: Compress = ...,
+    protocol: int | None = ...,
+) -> None: ...
 def load_temporary_memmap(
     filename: str | Path | SupportsRead[bytes],
     mmap_mode: MmapMode,
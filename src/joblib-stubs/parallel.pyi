@@ -23,6 +23,7 @@ from joblib._typeshed import (
     ReturnGereratorUnordered,
     ReturnList,
     ReturnUnknown,
+    TaskStatus,
 )
 from joblib._utils import _Sentinel
 from joblib._utils import eval_expr as eval_expr
@@ -91,6 +92,11 @@ method: str | None
 
 class BatchedCalls:
     items: list[BatchedCall[..., Any]]
+    _size: int
+    _reducer_callback: Callable[[], Any] | None
+    _backend: ParallelBackendBase[Any]
+    _n_jobs: int | None
+    _pickle_cache: dict[Any, Any]
     def __init__(
         self,
         iterator_slice: Iterable[BatchedCall[..., Any]],
@@ -124,15 +130,16 @@ class BatchCompletionCallBack[T]:
     dispatch_timestamp: float
     batch_size: int
     parallel: Parallel
-    parallel_call_id: tuple[str, ...]
+    parallel_call_id: str
     job: futures.Future[T] | AsyncResult[T] | None
-    status: str
+    status: TaskStatus | None
+    _completion_timeout_counter: float | None
     def __init__(
         self, dispatch_timestamp: float, batch_size: int, parallel: Parallel
     ) -> None: ...
     def register_job(self, job: futures.Future[T] | AsyncResult[T]) -> None: ...
-    def get_result(self, timeout: float) -> Any: ...
-    def get_status(self, timeout: float) -> str: ...
+    def get_result(self, timeout: float | None) -> Any: ...
+    def get_status(self, timeout: float | None) -> TaskStatus | None: ...
     def __call__(self, *args: Any, **kwargs: Any) -> None: ...
 
 def register_parallel_backend(
@@ -143,9 +150,11 @@ def effective_n_jobs(n_jobs: int = ...) -> int: ...
 class Parallel(Logger, Generic[_R]):
     _backend: ParallelBackendBase[_R]
     _backend_kwargs: dict[str, Any]
+    _call_id: str
     verbose: int
     timeout: float | None
     pre_dispatch: int | str
+    _pre_dispatch_amount: int
     return_as: _R
     return_generator: bool
     return_ordered: bool
@@ -274,6 +283,7 @@ class Parallel(Logger, Generic[_R]):
     def dispatch_next(self) -> None: ...
     def dispatch_one_batch(self, iterator: Iterable[BatchedCall[..., Any]]) -> bool: ...
     def print_progress(self) -> None: ...
+    def _get_batch_size(self) -> int: ...
     @overload
     def __call__[T](
         self: Parallel[ReturnList], iterable: Iterable[BatchedCall[..., T]]
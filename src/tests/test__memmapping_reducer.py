@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import inspect
+import pickle
 from typing import assert_type
 
 import joblib._memmapping_reducer as mod
+import numpy as np
+import pytest
 
 
 class TestConstants:
@@ -81,6 +84,25 @@ class TestUnlinkFile:
         assert callable(mod.unlink_file)
 
 
+class TestWeakArrayKeyMap:
+    """Test _WeakArrayKeyMap class."""
+
+    def test_set_and_get(self) -> None:
+        """_WeakArrayKeyMap should map objects by identity."""
+        mapping = mod._WeakArrayKeyMap()  # noqa: SLF001
+        key = np.zeros(3)
+        mapping.set(key, "digest")
+        assert mapping.get(key) == "digest"
+        with pytest.raises(KeyError):
+            mapping.get(np.zeros(3))
+
+    def test_not_picklable(self) -> None:
+        """_WeakArrayKeyMap should refuse to be pickled."""
+        mapping = mod._WeakArrayKeyMap()  # noqa: SLF001
+        with pytest.raises(pickle.PicklingError):
+            pickle.dumps(mapping)
+
+
 class TestHasShareableMemory:
     """Test has_shareable_memory function."""
 
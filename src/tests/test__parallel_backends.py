@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import inspect
 from abc import ABCMeta
+from typing import assert_type
 
 import joblib._parallel_backends as mod
+import pytest
 
 
 class TestParallelBackendBase:
@@ -94,6 +96,37 @@ class TestAutoBatchingMixin:
         assert hasattr(mod.AutoBatchingMixin, "batch_completed")
         assert hasattr(mod.AutoBatchingMixin, "reset_batch_stats")
 
+    def test_batch_stats(self) -> None:
+        """AutoBatchingMixin should track a smoothed duration per batch size."""
+        backend = mod.LokyBackend()
+        assert_type(backend._effective_batch_size, int)  # noqa: SLF001
+        assert_type(backend._smoothed_batch_duration, float)  # noqa: SLF001
+        assert (
+            backend._effective_batch_size  # noqa: SLF001
+            == mod.AutoBatchingMixin._DEFAULT_EFFECTIVE_BATCH_SIZE  # noqa: SLF001
+        )
+        backend.batch_completed(1, 0.5)
+        backend.batch_completed(1, 1.0)
+        assert backend._smoothed_batch_duration == pytest.approx(0.6)  # noqa: SLF001
+        backend.reset_batch_stats()
+        assert (
+            backend._smoothed_batch_duration  # noqa: SLF001
+            == mod.AutoBatchingMixin._DEFAULT_SMOOTHED_BATCH_DURATION  # noqa: SLF001
+        )
+
+    def test_custom_batching_strategy(self) -> None:
+        """Subclasses should be able to drive batch sizing from the stats."""
+
+        class FixedBatchBackend(mod.LokyBackend):
+            def compute_batch_size(self) -> int:
+                self._effective_batch_size = 4
+                return self._effective_batch_size
+
+        backend = FixedBatchBackend()
+        assert backend.compute_batch_size() == 4
+        backend.reset_batch_stats()
+        assert backend._effective_batch_size == 1  # noqa: SLF001
+
 
 class TestThreadingBackend:
     """Test ThreadingBackend class."""
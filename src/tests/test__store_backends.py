@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import inspect
+import os
+import shutil
+import tempfile
 from abc import ABCMeta
 from datetime import datetime
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Literal, assert_type
 
 import joblib._store_backends as mod
 
+if TYPE_CHECKING:
+    from joblib._typeshed import MmapMode
+
 
 class TestCacheItemInfo:
     """Test CacheItemInfo named tuple."""
@@ -95,6 +103,53 @@ class TestStoreBackendBase:
         assert hasattr(mod.StoreBackendBase, "get_items")
         assert hasattr(mod.StoreBackendBase, "configure")
 
+    def test_private_abstract_methods(self) -> None:
+        """StoreBackendBase should require the private item hooks."""
+        abstract = mod.StoreBackendBase.__abstractmethods__
+        assert {"_open_item", "_item_exists", "_move_item"} <= abstract
+
+    def test_custom_backend(self) -> None:
+        """A subclass implementing every abstract method should work."""
+
+        class CustomStoreBackend(mod.StoreBackendBase, mod.StoreBackendMixin):
+            compress: bool = False
+            verbose: int = 0
+
+            def _open_item(self, f: str, mode: Literal["rb", "wb"]) -> IO[bytes]:
+                return Path(f).open(mode)
+
+            def _item_exists(self, location: str) -> bool:
+                return Path(location).exists()
+
+            def _move_item(self, src: str, dst: str) -> None:
+                Path(src).replace(dst)
+
+            def create_location(self, location: str) -> None:
+                Path(location).mkdir(parents=True, exist_ok=True)
+
+            def clear_location(self, location: str) -> None:
+                shutil.rmtree(location, ignore_errors=True)
+
+            def get_items(self) -> list[mod.CacheItemInfo]:
+                return []
+
+            def configure(
+                self,
+                location: str,
+                verbose: int = 0,
+                backend_options: dict[str, Any] | None = None,
+            ) -> None:
+                self.location = location
+                self.verbose = verbose
+                self.compress = bool((backend_options or {}).get("compress"))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = CustomStoreBackend()
+            backend.configure(tmpdir)
+            backend.dump_item(("func", "args"), 42, verbose=0)
+            assert backend.contains_item(("func", "args"))
+            assert backend.load_item(("func", "args"), verbose=0) == 42
+
 
 class TestStoreBackendMixin:
     """Test StoreBackendMixin class."""
@@ -128,6 +183,45 @@ class TestStoreBackendMixin:
         for method in methods:
             assert hasattr(mod.StoreBackendMixin, method), f"Missing method: {method}"
 
+    def test_get_items_to_delete(self) -> None:
+        """_get_items_to_delete should return the items to evict."""
+        sig = inspect.signature(mod.StoreBackendMixin._get_items_to_delete)  # noqa: SLF001
+        params = list(sig.parameters.keys())
+        assert params == ["self", "bytes_limit", "items_limit", "age_limit"]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = mod.FileSystemStoreBackend()
+            backend.configure(tmpdir)
+            for index, call_hash in enumerate(["a" * 32, "b" * 32, "c" * 32]):
+                backend.dump_item(("func", call_hash), index, verbose=0)
+                output = Path(tmpdir) / "func" / call_hash / "output.pkl"
+                os.utime(output, (1000 + index, 1000 + index))
+
+            items = backend._get_items_to_delete(None, items_limit=1)  # noqa: SLF001
+            assert_type(items, list[mod.CacheItemInfo])
+            to_delete = sorted(Path(item.path).name for item in items)
+            assert to_delete == ["a" * 32, "b" * 32]
+
+            backend.enforce_store_limits(None, items_limit=1)
+            remaining = [Path(item.path).name for item in backend.get_items()]
+            assert remaining == ["c" * 32]
+
+    def test_concurrency_safe_write(self) -> None:
+        """_concurrency_safe_write should move the written file in place."""
+        sig = inspect.signature(mod.StoreBackendMixin._concurrency_safe_write)  # noqa: SLF001
+        params = list(sig.parameters.keys())
+        assert params == ["self", "to_write", "filename", "write_func"]
+
+        def write_func(to_write: bytes, dest_filename: str) -> None:
+            Path(dest_filename).write_bytes(to_write)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = mod.FileSystemStoreBackend()
+            backend.configure(tmpdir)
+            filename = str(Path(tmpdir) / "output.pkl")
+            backend._concurrency_safe_write(b"data", filename, write_func)  # noqa: SLF001
+            assert Path(filename).read_bytes() == b"data"
+
 
 class TestFileSystemStoreBackend:
     """Test FileSystemStoreBackend class."""
@@ -144,3 +238,16 @@ class TestFileSystemStoreBackend:
         """FileSystemStoreBackend should inherit from correct bases."""
         assert issubclass(mod.FileSystemStoreBackend, mod.StoreBackendBase)
         assert issubclass(mod.FileSystemStoreBackend, mod.StoreBackendMixin)
+
+    def test_mmap_mode_attribute(self) -> None:
+        """FileSystemStoreBackend.mmap_mode should be None unless configured."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = mod.FileSystemStoreBackend()
+            backend.configure(tmpdir, backend_options={"mmap_mode": "r"})
+            if TYPE_CHECKING:
+                assert_type(backend.mmap_mode, MmapMode | None)
+            assert backend.mmap_mode == "r"
+
+            default_backend = mod.FileSystemStoreBackend()
+            default_backend.configure(tmpdir)
+            assert default_backend.mmap_mode is None
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import ast
 import inspect
+from collections.abc import Callable
+from typing import Any, assert_type
 
 import joblib._utils as mod
 
@@ -18,6 +21,12 @@ class TestOperators:
         """operators should be a dict."""
         assert isinstance(mod.operators, dict)
 
+    def test_keys_are_node_types(self) -> None:
+        """operators should be keyed by ast node classes."""
+        assert_type(mod.operators, dict[type[ast.AST], Callable[..., Any]])
+        assert mod.operators[ast.Mult](2, 3) == 6
+        assert mod.operators[ast.USub](2) == -2
+
 
 class TestEvalExpr:
     """Test eval_expr function."""
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
 import inspect
 import pickle
-from typing import assert_type
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, assert_type
 
 import joblib.hashing as mod
+import numpy as np
+import pytest
+
+if TYPE_CHECKING:
+    from _hashlib import HASH
 
 
 class TestPickler:
@@ -57,6 +64,26 @@ class TestHasher:
         assert_type(result, str)
         assert isinstance(result, str)
 
+    def test_hash_without_digest(self) -> None:
+        """Hasher.hash should only feed the hash object without return_digest."""
+        hasher = mod.Hasher()
+        hasher.hash("test", return_digest=False)
+        assert hasher._hash.hexdigest() == mod.Hasher().hash("test")  # noqa: SLF001
+
+    @pytest.mark.parametrize("return_digest", [True, False])
+    def test_hash_return_digest_flag(self, return_digest: bool) -> None:
+        """Hasher.hash should return a digest only when requested."""
+        result = mod.Hasher().hash("test", return_digest=return_digest)
+        assert_type(result, str | None)
+        assert isinstance(result, str) is return_digest
+
+    def test_hashlib_algorithm(self) -> None:
+        """Hasher should accept any hashlib algorithm name."""
+        result = mod.Hasher(hash_name="blake2b").hash("test")
+        assert_type(result, str)
+        assert len(result) == hashlib.blake2b().digest_size * 2
+        assert result != mod.Hasher(hash_name="md5").hash("test")
+
     def test_save_method(self) -> None:
         """Hasher.save should exist."""
         sig = inspect.signature(mod.Hasher.save)
@@ -80,6 +107,32 @@ class TestHasher:
         assert "name" in params
         assert "pack" in params
 
+    def test_dispatch_table(self) -> None:
+        """Hasher.dispatch should route types to the hashing save methods."""
+        assert_type(mod.Hasher.dispatch, dict[type[Any], Callable[[Any, Any], None]])
+        assert mod.Hasher.dispatch is not mod.Pickler.dispatch
+        assert mod.Hasher.dispatch[set].__name__ == "save_set"
+        assert mod.Hasher.dispatch[type].__name__ == "save_global"
+
+    def test_dispatch_registration(self) -> None:
+        """Hasher subclasses should be able to register their own save methods."""
+
+        class Version:
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        class VersionHasher(mod.Hasher):
+            dispatch = mod.Hasher.dispatch.copy()
+
+            def save_version(self, obj: Version) -> None:
+                self.save(("Version", obj.value))
+
+            dispatch[Version] = save_version
+
+        assert Version not in mod.Hasher.dispatch
+        result = VersionHasher().hash(Version(1))
+        assert result == mod.Hasher().hash(("Version", 1))
+
     def test_save_set_method(self) -> None:
         """Hasher.save_set should exist."""
         sig = inspect.signature(mod.Hasher.save_set)
@@ -115,6 +168,21 @@ class TestNumpyHasher:
         assert isinstance(obj.coerce_mmap, bool)
         assert hasattr(obj, "np")
 
+    def test_hash_object(self) -> None:
+        """NumpyHasher should feed array buffers to its hash object."""
+        hasher = mod.NumpyHasher(hash_name="sha1")
+        if TYPE_CHECKING:
+            assert_type(hasher._hash, HASH)  # noqa: SLF001
+        assert hasher._hash.name == "sha1"  # noqa: SLF001
+        result = hasher.hash(np.arange(10))
+        assert result == hasher._hash.hexdigest()  # noqa: SLF001
+
+    def test_hashlib_algorithm(self) -> None:
+        """NumpyHasher should accept any hashlib algorithm name."""
+        result = mod.NumpyHasher(hash_name="sha256").hash(np.arange(10))
+        assert_type(result, str)
+        assert len(result) == hashlib.sha256().digest_size * 2
+
     def test_save_method(self) -> None:
         """NumpyHasher.save should exist."""
         sig = inspect.signature(mod.NumpyHasher.save)
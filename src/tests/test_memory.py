@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import tempfile
+from collections.abc import Awaitable
+from datetime import timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, assert_type
+from typing import TYPE_CHECKING, Any, assert_type
 
 import joblib.memory as mod
+import pytest
 from joblib.logger import Logger  # Different module for inheritance check
 
+if TYPE_CHECKING:
+    from joblib._typeshed import Compress, MmapMode
+
 
 class TestConstants:
     """Test module-level constants."""
@@ -102,6 +109,43 @@ class TestMemorizedResult:
         assert "timestamp" in params
         assert "metadata" in params
 
+    def test_call_id_properties(self) -> None:
+        """MemorizedResult should expose the ids of the shelved call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result: mod.MemorizedResult[int] = mod.MemorizedResult(
+                tmpdir, ("func", "args"), metadata={}
+            )
+            assert_type(result.func_id, str)
+            assert_type(result.args_id, str)
+            assert result.func_id == "func"
+            assert result.args_id == "args"
+            assert not hasattr(result, "argument_hash")
+
+    def test_metadata_attributes(self) -> None:
+        """MemorizedResult should expose the stored call metadata."""
+
+        def sample_func(x: int) -> int:
+            return x * 2
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cached = mod.Memory(tmpdir, verbose=0).cache(sample_func)
+            result = cached.call_and_shelve(21)
+            assert isinstance(result, mod.MemorizedResult)
+            assert_type(result.metadata, dict[str, Any])
+            assert_type(result.duration, float | None)
+            assert_type(result.timestamp, float | None)
+            if TYPE_CHECKING:
+                assert_type(result.mmap_mode, MmapMode | None)
+            assert isinstance(result.duration, float)
+            assert result.duration == result.metadata["duration"]
+            assert result.get() == 42
+
+            missing: mod.MemorizedResult[int] = mod.MemorizedResult(
+                tmpdir, ("func", "args")
+            )
+            assert missing.duration is None
+            assert missing.mmap_mode is None
+
     def test_get_method(self) -> None:
         """MemorizedResult.get should exist."""
         sig = inspect.signature(mod.MemorizedResult.get)
@@ -227,6 +271,17 @@ class TestNotMemorizedFunc:
         params = list(sig.parameters.keys())
         assert "self" in params
 
+    def test_check_call_in_cache_return_type(self) -> None:
+        """NotMemorizedFunc.check_call_in_cache should never report a hit."""
+
+        def sample_func(x: int) -> int:
+            return x * 2
+
+        obj = mod.NotMemorizedFunc(sample_func)
+        result = obj.check_call_in_cache(21)
+        assert_type(result, bool)
+        assert result is False
+
 
 class TestAsyncNotMemorizedFunc:
     """Test AsyncNotMemorizedFunc class type hints."""
@@ -246,6 +301,22 @@ class TestAsyncNotMemorizedFunc:
         params = list(sig.parameters.keys())
         assert params == ["self", "func"]
 
+    def test_call_return_type(self) -> None:
+        """AsyncNotMemorizedFunc.call should forward the call arguments."""
+
+        async def sample_func(x: int) -> int:
+            return x * 2
+
+        async def consume(awaitable: Awaitable[int]) -> int:
+            return await awaitable
+
+        obj = mod.AsyncNotMemorizedFunc(sample_func)
+        output, metadata = obj.call(21)
+        assert_type(output, Awaitable[int])
+        assert_type(metadata, dict[Any, Any])
+        assert asyncio.run(consume(output)) == 42
+        assert metadata == {}
+
 
 class TestMemorizedFunc:
     """Test MemorizedFunc class type hints."""
@@ -296,6 +367,20 @@ class TestMemorizedFunc:
             assert_type(result, int)
             assert result == 42
 
+    def test_store_backend_location(self) -> None:
+        """MemorizedFunc should accept a store backend instance as location."""
+
+        def sample_func(x: int) -> int:
+            return x * 2
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store_backend = mod.Memory(tmpdir).store_backend
+            obj = mod.MemorizedFunc(sample_func, store_backend)
+            assert obj.store_backend is store_backend
+            result = obj(21)
+            assert_type(result, int)
+            assert result == 42
+
     def test_call_and_shelve_method(self) -> None:
         """MemorizedFunc.call_and_shelve should exist."""
         sig = inspect.signature(mod.MemorizedFunc.call_and_shelve)
@@ -418,6 +503,35 @@ class TestMemory:
         assert "items_limit" in params
         assert "age_limit" in params
 
+    def test_reduce_size_limits(self) -> None:
+        """Memory.reduce_size should evict items beyond the given limits."""
+
+        def sample_func(x: int) -> int:
+            return x
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mem = mod.Memory(tmpdir, verbose=0)
+            cached = mem.cache(sample_func)
+            for i in range(3):
+                cached(i)
+            mem.reduce_size(
+                bytes_limit="1M", items_limit=1, age_limit=timedelta(days=1)
+            )
+            assert len(mem.store_backend.get_items()) == 1
+
+    def test_limits_are_not_init_options(self) -> None:
+        """Cache limits are enforced through reduce_size, not Memory.__init__."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(TypeError):
+                # pyrefly: ignore [unexpected-keyword]
+                mod.Memory(tmpdir, bytes_limit=1)  # type: ignore[call-arg]
+            with pytest.raises(TypeError):
+                # pyrefly: ignore [unexpected-keyword]
+                mod.Memory(tmpdir, items_limit=1)  # type: ignore[call-arg]
+            with pytest.raises(TypeError):
+                # pyrefly: ignore [unexpected-keyword]
+                mod.Memory(tmpdir, age_limit=timedelta(days=1))  # type: ignore[call-arg]
+
     def test_eval_method(self) -> None:
         """Memory.eval should exist."""
         sig = inspect.signature(mod.Memory.eval)
@@ -425,12 +539,53 @@ class TestMemory:
         assert "self" in params
         assert "func" in params
 
+    def test_store_backend_location(self) -> None:
+        """Memory should accept a store backend instance as location."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store_backend = mod.Memory(tmpdir).store_backend
+            mem = mod.Memory(store_backend)
+            assert mem.store_backend is store_backend
+            assert mem.location is store_backend
+
+    def test_compress_option(self) -> None:
+        """Memory should forward compressor names and levels to the store."""
+
+        def sample_func(x: int) -> int:
+            return x * 2
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mem = mod.Memory(tmpdir, compress=("zlib", 3), verbose=0)
+            if TYPE_CHECKING:
+                assert_type(mem.compress, Compress)
+            cached = mem.cache(sample_func)
+            assert cached(21) == 42
+            assert cached(21) == 42
+            backend = mem.store_backend
+            assert isinstance(backend, mod.FileSystemStoreBackend)
+            assert backend.compress == ("zlib", 3)
+
+    def test_mmap_mode_attribute(self) -> None:
+        """Memory and MemorizedFunc mmap_mode should default to None."""
+
+        def sample_func(x: int) -> int:
+            return x
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mem = mod.Memory(tmpdir, verbose=0)
+            cached = mem.cache(sample_func)
+            if TYPE_CHECKING:
+                assert_type(mem.mmap_mode, MmapMode | None)
+                assert_type(cached.mmap_mode, MmapMode | None)
+            assert mem.mmap_mode is None
+            assert cached.mmap_mode is None
+
     def test_memory_instantiation(self) -> None:
         """Memory should be instantiable."""
         with tempfile.TemporaryDirectory() as tmpdir:
             mem = mod.Memory(tmpdir)
-            assert_type(mem.location, str | Path)
+            assert_type(mem.location, str | Path | mod.StoreBackendBase | None)
             assert isinstance(mem.location, (str, Path))
+            assert mod.Memory().location is None
 
 
 class TestExpiresAfter:
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import bz2
 import inspect
-from typing import assert_type
+import io
+import pickle
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, assert_type
 
 import joblib.numpy_pickle as mod
-from joblib import numpy_pickle_utils
+import numpy as np
+import pytest
+from joblib import compressor, numpy_pickle_utils
+from joblib.compressor import CompressorWrapper
+
+if TYPE_CHECKING:
+    from joblib._typeshed import Compress, MmapMode
 
 
 class TestConstants:
@@ -49,6 +62,28 @@ class TestNumpyArrayWrapper:
         params = list(sig.parameters.keys())
         assert params == ["self"]
 
+    def test_numpy_array_alignment_bytes(self) -> None:
+        """NumpyArrayWrapper alignment should be an optional byte count."""
+        wrapper = mod.NumpyArrayWrapper(np.ndarray, (3,), "C", np.dtype("float64"))
+        result = wrapper.safe_get_numpy_array_alignment_bytes()
+        assert_type(result, int | None)
+        assert result == mod.NUMPY_ARRAY_ALIGNMENT_BYTES
+        unaligned = mod.NumpyArrayWrapper(
+            np.ndarray, (3,), "C", np.dtype("float64"), numpy_array_alignment_bytes=None
+        )
+        assert unaligned.safe_get_numpy_array_alignment_bytes() is None
+
+    def test_non_seekable_target_is_unaligned(self) -> None:
+        """NumpyPickler should skip alignment when the target cannot tell."""
+
+        class NonSeekable(io.BytesIO):
+            def tell(self) -> int:
+                raise io.UnsupportedOperation
+
+        pickler = mod.NumpyPickler(NonSeekable())
+        wrapper = pickler._create_array_wrapper(np.arange(3))  # noqa: SLF001
+        assert wrapper.numpy_array_alignment_bytes is None
+
     def test_write_array_method(self) -> None:
         """NumpyArrayWrapper.write_array should exist."""
         sig = inspect.signature(mod.NumpyArrayWrapper.write_array)
@@ -101,6 +136,25 @@ class TestNumpyPickler:
         assert "fp" in params
         assert "protocol" in params
 
+    def test_attributes(self) -> None:
+        """NumpyPickler np should be optional."""
+        pickler = mod.NumpyPickler(io.BytesIO())
+        assert_type(pickler.np, ModuleType | None)
+        assert pickler.np is np
+
+    def test_array_wrapper_round_trip(self) -> None:
+        """NumpyArrayWrapper should write through NumpyPickler and read back."""
+        buffer = io.BytesIO()
+        pickler = mod.NumpyPickler(buffer)
+        array = np.arange(6.0)
+        wrapper = pickler._create_array_wrapper(array)  # noqa: SLF001
+        assert_type(wrapper, mod.NumpyArrayWrapper)
+        wrapper.write_array(array, pickler)
+        buffer.seek(0)
+        unpickler = mod.NumpyUnpickler("", buffer, False)  # noqa: FBT003
+        result = wrapper.read(unpickler, False)  # noqa: FBT003
+        assert result.tolist() == array.tolist()
+
     def test_save_method(self) -> None:
         """NumpyPickler.save should exist."""
         sig = inspect.signature(mod.NumpyPickler.save)
@@ -131,6 +185,57 @@ class TestNumpyUnpickler:
         assert "ensure_native_byte_order" in params
         assert "mmap_mode" in params
 
+    def test_attributes(self) -> None:
+        """NumpyUnpickler mmap_mode and np should be optional."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.pkl"
+            mod.dump(np.arange(10), path)
+            with path.open("rb") as f:
+                unpickler = mod.NumpyUnpickler(str(path), f, False)  # noqa: FBT003
+                if TYPE_CHECKING:
+                    assert_type(unpickler.mmap_mode, MmapMode | None)
+                assert_type(unpickler.np, ModuleType | None)
+                assert unpickler.mmap_mode is None
+                assert unpickler.np is np
+
+    def test_mmap_partial_read(self) -> None:
+        """NumpyUnpickler should memory map arrays when mmap_mode is set."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.pkl"
+            mod.dump(np.arange(10), path)
+            array = mod.load(path, mmap_mode="r")
+            assert isinstance(array, np.memmap)
+            assert array[2:4].tolist() == [2, 3]
+            del array
+
+    def test_dispatch_table(self) -> None:
+        """NumpyUnpickler.dispatch should route BUILD to load_build."""
+        assert_type(mod.NumpyUnpickler.dispatch, dict[int, Callable[[Any], None]])
+        assert mod.NumpyUnpickler.dispatch is not numpy_pickle_utils.Unpickler.dispatch
+        assert mod.NumpyUnpickler.dispatch[pickle.BUILD[0]].__name__ == "load_build"
+
+    def test_dispatch_registration(self) -> None:
+        """NumpyUnpickler subclasses should be able to register opcode handlers."""
+
+        class CountingUnpickler(mod.NumpyUnpickler):
+            dispatch = mod.NumpyUnpickler.dispatch.copy()
+            builds: int = 0
+
+            def load_build(self) -> None:
+                self.builds += 1
+                super().load_build()
+
+            dispatch[pickle.BUILD[0]] = load_build
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.pkl"
+            mod.dump(np.arange(3), path)
+            with path.open("rb") as f:
+                unpickler = CountingUnpickler(str(path), f, False)  # noqa: FBT003
+                result = unpickler.load()
+        assert result.tolist() == [0, 1, 2]
+        assert unpickler.builds > 0
+
     def test_load_build_method(self) -> None:
         """NumpyUnpickler.load_build should exist."""
         sig = inspect.signature(mod.NumpyUnpickler.load_build)
@@ -155,6 +260,39 @@ class TestDump:
         assert "compress" in params
         assert "protocol" in params
 
+    @pytest.mark.parametrize("compress", [True, 3, "zlib", ("gzip", 3)])
+    def test_compress_options(self, compress: Compress) -> None:
+        """dump should accept every supported compress option."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = str(Path(tmpdir) / "data.pkl")
+            mod.dump([1, 2, 3], filename, compress=compress)
+            assert mod.load(filename) == [1, 2, 3]
+
+    def test_return_type(self) -> None:
+        """dump should list the created file only for filename targets."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.pkl"
+            result = mod.dump([1, 2, 3], path, compress=3)
+            assert_type(result, list[str])
+            assert result == [str(path)]
+            with path.open("wb") as f:
+                mod.dump([1, 2, 3], f, compress=3)
+            assert mod.load(path) == [1, 2, 3]
+
+    def test_registered_compressor(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """dump should accept compressors added with register_compressor."""
+        wrapper: CompressorWrapper[bz2.BZ2File] = CompressorWrapper(
+            bz2.BZ2File, prefix=b"BZh", extension=".stubbz2"
+        )
+        # Let monkeypatch remove the entry again so it cannot leak into
+        # other tests sharing joblib's global compressor registry.
+        monkeypatch.setitem(compressor._COMPRESSORS, "stub-bz2", wrapper)  # noqa: SLF001
+        mod.register_compressor("stub-bz2", wrapper, force=True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = str(Path(tmpdir) / "data.pkl")
+            mod.dump([1, 2, 3], filename, compress=("stub-bz2", 3))
+            assert mod.load(filename) == [1, 2, 3]
+
 
 class TestLoadTemporaryMemmap:
     """Test load_temporary_memmap function type hints."""
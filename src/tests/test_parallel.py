@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import inspect
+import time
 from typing import TYPE_CHECKING, Any, Literal, assert_type
 
 import joblib.parallel as mod
+import pytest
+
+if TYPE_CHECKING:
+    from joblib._typeshed import TaskStatus
 
 
 class TestModuleConstants:
@@ -176,6 +181,20 @@ class TestBatchedCalls:
         assert hasattr(obj, "items")
         assert isinstance(obj.items, list)
 
+    def test_pickle_cache(self) -> None:
+        """BatchedCalls should carry its pickle cache across pickling."""
+        backend, _ = mod.get_active_backend()
+        cache: dict[Any, Any] = {}
+        obj = mod.BatchedCalls([(abs, (-1,), {})], backend, pickle_cache=cache)
+        assert obj._pickle_cache is cache  # noqa: SLF001
+        assert_type(obj._n_jobs, int | None)  # noqa: SLF001
+        assert obj._n_jobs is None  # noqa: SLF001
+        assert obj._backend is backend  # noqa: SLF001
+        _, args = obj.__reduce__()
+        assert args[1] == (backend, None)
+        assert args[3] is cache
+        assert obj() == [1]
+
 
 class TestCpuCount:
     """Test cpu_count function type hints."""
@@ -284,6 +303,23 @@ class TestBatchCompletionCallBack:
         assert "self" in params
         assert "timeout" in params
 
+    def test_status(self) -> None:
+        """BatchCompletionCallBack status should be one of the TASK_* values."""
+        parallel = mod.Parallel(n_jobs=2, backend="threading")
+        parallel._call_id = "call"  # noqa: SLF001
+        callback: mod.BatchCompletionCallBack[Any] = mod.BatchCompletionCallBack(
+            time.time(), 1, parallel
+        )
+        assert_type(callback.parallel_call_id, str)
+        assert callback.parallel_call_id == "call"
+        if TYPE_CHECKING:
+            assert_type(callback.status, TaskStatus | None)
+        assert callback.status == mod.TASK_PENDING
+        status = callback.get_status(None)
+        if TYPE_CHECKING:
+            assert_type(status, TaskStatus | None)
+        assert status == mod.TASK_PENDING
+
 
 class TestRegisterParallelBackend:
     """Test register_parallel_backend function type hints."""
@@ -396,6 +432,49 @@ class TestParallel:
         params = list(sig.parameters.keys())
         assert params == ["self"]
 
+    def test_get_batch_size(self) -> None:
+        """Parallel._get_batch_size should follow the backend batch statistics."""
+        profile = {"sample": 8}
+
+        class WarmStartBackend(mod.LokyBackend):
+            # AutoBatchingMixin.__init__ sets the statistics directly, and
+            # reset_batch_stats only runs when the backend is terminated.
+            def __init__(self, **kwargs: Any) -> None:
+                super().__init__(**kwargs)
+                self._seed_batch_size()
+
+            def reset_batch_stats(self) -> None:
+                super().reset_batch_stats()
+                self._seed_batch_size()
+
+            def _seed_batch_size(self) -> None:
+                self._effective_batch_size = profile.get(
+                    "sample", self._DEFAULT_EFFECTIVE_BATCH_SIZE
+                )
+
+        backend = WarmStartBackend()
+        parallel = mod.Parallel(n_jobs=2, backend=backend, batch_size="auto")
+        result = parallel._get_batch_size()  # noqa: SLF001
+        assert_type(result, int)
+        assert result == 8
+        profile["sample"] = 16
+        # LokyBackend.terminate ends with this call once a run is over.
+        backend.reset_batch_stats()
+        assert parallel._get_batch_size() == 16  # noqa: SLF001
+        assert mod.Parallel(n_jobs=1, batch_size=3)._get_batch_size() == 3  # noqa: SLF001
+
+    @pytest.mark.parametrize(
+        ("pre_dispatch", "expected"), [("2*n_jobs", 4), (3, 3), ("all", 0)]
+    )
+    def test_pre_dispatch_amount(self, pre_dispatch: int | str, expected: int) -> None:
+        """Parallel should resolve pre_dispatch to a number of tasks."""
+        parallel = mod.Parallel(
+            n_jobs=2, backend="threading", pre_dispatch=pre_dispatch
+        )
+        assert parallel(mod.delayed(abs)(-i) for i in range(8)) == list(range(8))
+        assert_type(parallel._pre_dispatch_amount, int)  # noqa: SLF001
+        assert parallel._pre_dispatch_amount == expected  # noqa: SLF001
+
     def test_attributes(self) -> None:
         """Parallel attributes should have correct types."""
         obj = mod.Parallel(n_jobs=1, verbose=0, timeout=None)